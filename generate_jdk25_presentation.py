@@ -1,8 +1,8 @@
 import argparse
 import sys
 from datetime import datetime
-from presentation_generator import JDKPresentationGenerator, JDKRelease, JEP
-from jdk_scraper import JDKScraper
+from presentation_generator import JDKPresentationGenerator, JDKRelease
+from sample_data import SAMPLE_JEPS
 
 def create_sample_jdk_release(version: str, tagline: str = "The Future of Java") -> JDKRelease:
     """
@@ -11,93 +11,51 @@ def create_sample_jdk_release(version: str, tagline: str = "The Future of Java")
     Otherwise, falls back to sample data.
     """
     try:
-        # Try to fetch real data for JDK 25 or later
-        if int(version) >= 25:
-            release_info = JDKScraper.get_jdk_release_info(version)
-            if release_info:
-                release = JDKRelease(
-                    version=version,
-                    release_date=release_info['release_date'],
-                    tagline=tagline
-                )
-                
-                # Add JEPs from the scraped data
-                for jep in release_info.get('jeps', []):
-                    release.add_jep(jep)
-                
-                if not release.jeps:
-                    print(f"Warning: No JEPs found for JDK {version}. Using sample data.")
-                    return _create_sample_jdk_release(version, tagline)
-                
-                return release
-        
-        # Fall back to sample data if scraping fails or for versions < 25
-        return _create_sample_jdk_release(version, tagline)
-        
-    except (ValueError, KeyError) as e:
+        major_version = int(version)
+    except ValueError as e:
         print(f"Error creating JDK release: {e}")
         print("Falling back to sample data.")
         return _create_sample_jdk_release(version, tagline)
-
-def _create_sample_jdk_release(version: str, tagline: str) -> JDKRelease:
-    """Create a sample JDK release with some JEPs (fallback)"""
+    
+    # Only JDK 25 or later is fetched; older versions use sample data
+    if major_version < 25:
+        return _create_sample_jdk_release(version, tagline)
+    
+    # Imported here so sample-data runs never load requests or bs4
+    from jdk_scraper import JDKScraper
+    
+    release_info = JDKScraper.get_jdk_release_info(version)
+    if not release_info:
+        # Fall back to sample data if scraping fails
+        return _create_sample_jdk_release(version, tagline)
+    
     release = JDKRelease(
         version=version,
-        release_date=f"{version}-10-22" if version.isdigit() else "2024-10-22",
+        release_date=release_info['release_date'],
         tagline=tagline
     )
     
-    # Add some sample JEPs
-    jep1 = JEP(
-        number="123",
-        title="Pattern Matching for switch (Preview)",
-        description="Enhance the Java programming language with pattern matching for switch expressions and statements.",
-        examples=[
-            {
-                "title": "Basic Pattern Matching in Switch",
-                'content': '''String response = switch (obj) {
-    case Integer i -> String.format(\"int %d\", i);
-    case String s -> String.format(\"String %s\", s);
-    default -> obj.toString();
-};'''
-            }
-        ]
-    )
+    # Add JEPs from the scraped data
+    for jep in release_info.get('jeps', []):
+        release.add_jep(jep)
     
-    jep2 = JEP(
-        number="456",
-        title="Virtual Threads (Second Preview)",
-        description="Introduce virtual threads to the Java Platform.",
-        examples=[
-            {
-                "title": "Creating Virtual Threads",
-                'content': '// Create a virtual thread\nThread.startVirtualThread(() -> {\n    System.out.println(\"Hello from virtual thread!\");\n});'
-            }
-        ]
-    )
-    
-    jep3 = JEP(
-        number="789",
-        title="Structured Concurrency (Incubator)",
-        description="Simplify multithreaded programming by treating multiple tasks running in different threads as a single unit of work.",
-        examples=[
-            {
-                'title': 'Structured Concurrency Example',
-                'content': '''try (var scope = StructuredTaskScope.ShutdownOnFailure()) {
-    Future<String> user = scope.fork(() -> findUser());
-    Future<Integer> order = scope.fork(() -> fetchOrder());
+    if not release.jeps:
+        print(f"Warning: No JEPs found for JDK {version}. Using sample data.")
+        return _create_sample_jdk_release(version, tagline)
     
-    scope.join();
-    return new Response(user.resultNow(), order.resultNow());
-}'''
-            }
-        ]
+    return release
+
+def _create_sample_jdk_release(version: str, tagline: str) -> JDKRelease:
+    """Create a sample JDK release with some JEPs (fallback)"""
+    release = JDKRelease(
+        version=version,
+        release_date=f"{version}-10-22" if version.isdigit() else "2024-10-22",
+        tagline=tagline
     )
     
-    # Add JEPs to the release
-    release.add_jep(jep1)
-    release.add_jep(jep2)
-    release.add_jep(jep3)
+    # Add the shared sample JEPs
+    for jep in SAMPLE_JEPS:
+        release.add_jep(jep)
     
     return release
 
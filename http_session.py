@@ -0,0 +1,64 @@
+from datetime import timedelta
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # Caching is optional; fall back to a plain session
+    requests_cache = None
+
+PAGE_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+IMAGE_TIMEOUT = (3.05, 60)  # Images can be much larger than HTML pages
+CACHE_NAME = 'jdk_cache'  # SQLite file used by requests-cache
+CACHE_EXPIRE_AFTER = timedelta(days=1)
+
+_page_session: Optional[requests.Session] = None
+_image_session: Optional[requests.Session] = None
+
+def _configure(session: requests.Session) -> requests.Session:
+    """Give `session` a keep-alive connection pool, retries and common headers"""
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    ))
+    session.headers.update({
+        'User-Agent': 'jdk-scraper/1.0',
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    return session
+
+def get_session() -> requests.Session:
+    """Return the shared session for HTML pages, creating it on first use.
+
+    All page fetches go through one keep-alive connection pool so repeated
+    requests to openjdk.org skip the TCP and TLS handshakes. When
+    requests-cache is installed, responses are also kept on disk so later
+    runs are served without touching the network.
+    """
+    global _page_session
+    if _page_session is None:
+        if requests_cache is not None:
+            session = requests_cache.CachedSession(
+                CACHE_NAME,
+                backend='sqlite',
+                expire_after=CACHE_EXPIRE_AFTER,
+                allowable_codes=(200,)
+            )
+        else:
+            session = requests.Session()
+        _page_session = _configure(session)
+    return _page_session
+
+def get_image_session() -> requests.Session:
+    """Return the shared session for image downloads, creating it on first use.
+
+    Deliberately not cached on disk: images are large binaries that would
+    bloat the page cache, and each is already kept in memory once fetched.
+    """
+    global _image_session
+    if _image_session is None:
+        _image_session = _configure(requests.Session())
+    return _image_session
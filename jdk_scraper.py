@@ -1,189 +1,264 @@
 import re
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import List, Dict, Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 
-@dataclass
-class JEP:
-    """Java Enhancement Proposal"""
-    number: str
-    title: str
-    description: str
-    examples: List[Dict[str, str]]
-    
-    @classmethod
-    def from_jep_page(cls, jep_url: str) -> 'JEP':
-        """
-        Fetch JEP details from its page
-        
-        Args:
-            jep_url: URL of the JEP page
-            
-        Returns:
-            JEP: A JEP object with details from the page
-            
-        Note:
-            This is a placeholder - actual implementation would need to parse the JEP page
-        """
-        # In a real implementation, we would fetch and parse the JEP page here
-        # For now, we'll return a basic JEP with a placeholder description
-        return cls(
-            number=jep_url.split('/')[-1],
-            title="",  # Will be set by the caller
-            description="Detailed description would be fetched from the JEP page",
-            examples=[]
-        )
+from http_session import PAGE_TIMEOUT, get_session
+
+# Re-exported so callers can keep importing JEP from the scraper
+from models import JEP
+
+# Headings that introduce the JEP list; heading text is lowercased before
+# matching, and these also cover "Features in JDK <version>" and the like
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4')
+_SECTION_NAMES = ('features', 'jeps')
+
+# Parse only the parts of the release page each extractor looks at:
+# headings and links (plus paragraphs for descriptions) for the JEP list,
+# and the milestones table for the release date
+_JEP_LINKS_STRAINER = SoupStrainer(['a', 'p', *_HEADING_TAGS])
+_MILESTONES_STRAINER = SoupStrainer('table', class_='milestones')
+
+# Patterns used while walking the release page, compiled once at import
+_JEP_HREF_RE = re.compile(r'jeps?[/-](\d+)', re.IGNORECASE)
+_JEP_TEXT_RE = re.compile(r'^jep\s*(\d+)[:\s]*(.*)', re.IGNORECASE)
+_JEP_TITLE_STRIP_RE = re.compile(r'^jep\s*\d+[:\s]*', re.IGNORECASE)
+_GA_DATE_RE = re.compile(
+    r'General Availability\s*[:]?\s*(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
+    re.IGNORECASE
+)
+_DATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in [
+    r'\b(?:Release )?Date\s*[:=]\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})\b',
+    r'\b(?:GA|General Availability).*?(\d{4}[/-]\d{1,2}[/-]\d{1,2})\b',
+    r'\b(?:GA|General Availability)\s+(?:on )?(\w+ \d{1,2}, \d{4})\b',
+    r'\b(?:Released on|as of)\s+(\w+ \d{1,2}, \d{4})\b',
+])
 
 class JDKScraper:
     BASE_URL = "https://openjdk.org"
+    MAX_WORKERS = 8  # Concurrent JEP page fetches; kept below the pool size
+    
+    _release_cache: Dict[Tuple[str, bool], dict] = {}
     
     @classmethod
-    def get_jdk_release_info(cls, version: str) -> dict:
+    def get_jdk_release_info(cls, version: str, fetch_details: bool = False) -> dict:
         """
         Fetch JDK release information from OpenJDK website
         
         Args:
             version: JDK version number (e.g., '25')
+            fetch_details: Also fetch each JEP's own page for its summary
             
         Returns:
             dict: Dictionary containing release information including JEPs
         """
+        cache_key = (version, fetch_details)
+        if cache_key in cls._release_cache:
+            return cls._copy_release_info(cls._release_cache[cache_key])
+        
         url = f"{cls.BASE_URL}/projects/jdk/{version}/"
         
         try:
-            response = requests.get(url)
+            response = get_session().get(url, timeout=PAGE_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            content = response.content
             
-            # Extract JEPs from the page
-            jeps = cls._extract_jeps(soup, version)
+            # Extract JEPs and the release date from partial parses of the page
+            jeps = cls._extract_jeps(cls._make_soup(content, _JEP_LINKS_STRAINER))
+            release_date = cls._extract_release_date(cls._make_soup(content, _MILESTONES_STRAINER))
             
-            # Get release date (this is a simplified example)
-            release_date = cls._extract_release_date(soup)
+            # Fall back to the whole document if either came up empty
+            if not jeps or not release_date:
+                soup = cls._make_soup(content)
+                jeps = jeps or cls._extract_jeps(soup)
+                release_date = release_date or cls._extract_release_date(soup)
             
-            return {
+            if fetch_details:
+                jeps = cls._fetch_jep_details(jeps)
+            
+            release_info = {
                 'version': version,
                 'release_date': release_date or f"{version}-03-01",  # Fallback date
                 'tagline': "The Future of Java",  # Default tagline
                 'jeps': jeps
             }
+            # Only successful scrapes are cached so a failed fetch is retried
+            cls._release_cache[cache_key] = release_info
+            return cls._copy_release_info(release_info)
             
         except requests.RequestException as e:
             print(f"Error fetching JDK {version} information: {e}")
             return None
     
     @staticmethod
-    def _extract_jeps(soup: BeautifulSoup, version: str) -> List[JEP]:
+    def _copy_release_info(release_info: dict) -> dict:
+        """Return a copy of a cached result that callers can modify freely.
+        
+        The dict and its JEP list are copied; the JEP objects are shared.
+        """
+        return dict(release_info, jeps=list(release_info['jeps']))
+    
+    @classmethod
+    def get_jep_info(cls, jep_url: str) -> JEP:
+        """
+        Fetch JEP details from its page
+        
+        Args:
+            jep_url: URL of the JEP page
+            
+        Returns:
+            JEP: A JEP object with the title and summary from the page
+            
+        Raises:
+            requests.RequestException: If the page cannot be fetched
+        """
+        response = get_session().get(jep_url, timeout=PAGE_TIMEOUT)
+        response.raise_for_status()
+        soup = cls._make_soup(response.content)
+        
+        # JEP pages title themselves "JEP <n>: <title>"
+        heading = soup.find('h1')
+        title = _JEP_TITLE_STRIP_RE.sub('', heading.get_text(strip=True)) if heading else ""
+        
+        # The first paragraph of the Summary section describes the JEP
+        description = ""
+        summary = soup.find(['h2', 'h3'], id='Summary')
+        if summary:
+            paragraph = summary.find_next('p')
+            if paragraph:
+                description = paragraph.get_text(' ', strip=True)
+        
+        return JEP(
+            number=jep_url.rstrip('/').split('/')[-1],
+            title=title,
+            description=description
+        )
+    
+    @classmethod
+    def _fetch_jep_details(cls, jeps: List[JEP]) -> List[JEP]:
+        """Fetch the page of every JEP concurrently and merge in its details.
+        
+        The fetches are I/O bound, so a thread pool sharing the pooled
+        session overlaps the round-trips. A JEP whose page cannot be fetched
+        is kept as scraped from the release page.
+        
+        Args:
+            jeps: JEPs extracted from the release page
+            
+        Returns:
+            List[JEP]: The JEPs, in the same order, with details filled in
+        """
+        def fetch(jep: JEP) -> Optional[JEP]:
+            try:
+                return cls.get_jep_info(f"{cls.BASE_URL}/jeps/{jep.number}")
+            except requests.RequestException as e:
+                print(f"Error fetching JEP {jep.number} details: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=cls.MAX_WORKERS) as executor:
+            details = list(executor.map(fetch, jeps))
+        
+        def title(jep: JEP, detail: JEP) -> str:
+            # _extract_jeps falls back to "JEP <number>" when the release
+            # page has no title, so the JEP page's own title wins over that
+            if detail.title and jep.title in ("", f"JEP {jep.number}"):
+                return detail.title
+            return jep.title
+        
+        return [
+            JEP(
+                number=jep.number,
+                title=title(jep, detail),
+                description=detail.description or jep.description,
+                examples=detail.examples or jep.examples
+            ) if detail else jep
+            for jep, detail in zip(jeps, details)
+        ]
+    
+    @staticmethod
+    def _make_soup(markup: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML with lxml, falling back to the pure-Python parser.
+        
+        Args:
+            markup: Raw response body; lxml detects the encoding itself
+            parse_only: Restrict the tree to the elements this strainer matches
+            
+        Returns:
+            BeautifulSoup: The parsed document
+        """
+        try:
+            return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+        except FeatureNotFound:
+            return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
+    
+    @staticmethod
+    def _extract_jeps(soup: BeautifulSoup) -> List[JEP]:
         """Extract JEPs from the JDK release page.
         
+        Headings and links are walked once in document order. JEPs listed
+        under a features/JEPs heading are preferred; if the page has no
+        such section, every JEP link found is returned instead.
+        
         Args:
             soup: BeautifulSoup object containing the parsed HTML
-            version: JDK version number
             
         Returns:
             List[JEP]: List of JEP objects found on the page
         """
-        jeps = []
+        section_jeps = []
+        other_jeps = []
         seen_jeps = set()  # To avoid duplicates
+        in_section = False  # Whether the most recent heading names a JEP section
         
-        # First, try to find JEPs in the features/jeps section
-        sections_to_try = [
-            f'features in jdk {version}',
-            f'jdk {version} features',
-            'features',
-            'jeps',
-            f'jdk {version} jeps'
-        ]
-        
-        for section_text in sections_to_try:
-            # Try to find a heading with the section text
-            heading = soup.find(['h1', 'h2', 'h3', 'h4'], 
-                              string=lambda t: t and section_text.lower() in t.lower())
+        # Headings and links come back in document order, so every link is
+        # seen right after the heading of the section it belongs to
+        for element in soup.find_all(_HEADING_TAGS + ('a',)):
+            if element.name != 'a':
+                heading_text = element.get_text().lower()
+                in_section = any(name in heading_text for name in _SECTION_NAMES)
+                continue
             
-            if heading:
-                # Find the parent container that holds the JEPs
-                container = heading.find_next(['div', 'section', 'article', 'ul', 'ol']) or heading.parent
-                
-                # Look for JEP links in this container
-                for link in container.find_all('a', href=True):
-                    href = link.get('href', '').lower()
-                    text = link.get_text(strip=True)
-                    
-                    # Skip empty links or non-JEP links
-                    if not href or not text:
-                        continue
-                        
-                    # Look for JEP number in href or text
-                    jep_num = None
-                    jep_title = None
-                    
-                    # Check href patterns like /jeps/123 or jep-123
-                    href_match = re.search(r'jeps?[/-](\d+)', href)
-                    if href_match:
-                        jep_num = href_match.group(1)
-                        jep_title = text
-                    # Check text patterns like "JEP 123: Title"
-                    elif re.search(r'^jep\s*\d+', text, re.IGNORECASE):
-                        text_match = re.search(r'jep\s*(\d+)[:\s]*(.*)', text, re.IGNORECASE)
-                        if text_match:
-                            jep_num = text_match.group(1)
-                            jep_title = text_match.group(2).strip()
-                    
-                    # If we found a JEP number we haven't seen before
-                    if jep_num and jep_num not in seen_jeps:
-                        seen_jeps.add(jep_num)
-                        jep_url = f"https://openjdk.org/jeps/{jep_num}"
-                        
-                        # Clean up the title
-                        if not jep_title or jep_title.lower().startswith('jep'):
-                            jep_title = f"JEP {jep_num}"
-                        
-                        # Get description from next element if it's a paragraph
-                        description = ""
-                        next_elem = link.find_next()
-                        if next_elem and next_elem.name == 'p':
-                            description = next_elem.get_text(strip=True)
-                        
-                        jep = JEP(
-                            number=jep_num,
-                            title=jep_title,
-                            description=description,
-                            examples=[]
-                        )
-                        jeps.append(jep)
-        
-        # If no JEPs found in sections, try a more general approach
-        if not jeps:
-            for link in soup.find_all('a', href=re.compile(r'jeps?[/-]\d+', re.IGNORECASE)):
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-                
-                if not href or not text:
+            href = element.get('href', '')
+            text = element.get_text(strip=True)
+            
+            # Skip empty links
+            if not href or not text:
+                continue
+            
+            # Check href patterns like /jeps/123 or jep-123, then text
+            # patterns like "JEP 123: Title"
+            href_match = _JEP_HREF_RE.search(href)
+            if href_match:
+                jep_num = href_match.group(1)
+                jep_title = _JEP_TITLE_STRIP_RE.sub('', text).strip()
+            else:
+                text_match = _JEP_TEXT_RE.search(text)
+                if not text_match:
                     continue
-                    
-                # Extract JEP number from href
-                jep_match = re.search(r'jeps?[/-](\d+)', href, re.IGNORECASE)
-                if jep_match:
-                    jep_num = jep_match.group(1)
-                    if jep_num not in seen_jeps:
-                        seen_jeps.add(jep_num)
-                        jep_url = f"https://openjdk.org/jeps/{jep_num}"
-                        
-                        # Clean up the title
-                        jep_title = text
-                        if jep_title.lower().startswith('jep'):
-                            jep_title = re.sub(r'^jep\s*\d+[:\s]*', '', jep_title, flags=re.IGNORECASE).strip()
-                        
-                        jep = JEP(
-                            number=jep_num,
-                            title=jep_title or f"JEP {jep_num}",
-                            description="",
-                            examples=[]
-                        )
-                        jeps.append(jep)
+                jep_num = text_match.group(1)
+                jep_title = text_match.group(2).strip()
+            
+            if jep_num in seen_jeps:
+                continue
+            seen_jeps.add(jep_num)
+            
+            # Get description from next element if it's a paragraph
+            description = ""
+            next_elem = element.find_next()
+            if next_elem and next_elem.name == 'p':
+                description = next_elem.get_text(strip=True)
+            
+            jep = JEP(
+                number=jep_num,
+                title=jep_title or f"JEP {jep_num}",
+                description=description,
+                examples=()
+            )
+            (section_jeps if in_section else other_jeps).append(jep)
         
-        return jeps
+        return section_jeps or other_jeps
     
     @staticmethod
     def _extract_release_date(soup: BeautifulSoup) -> Optional[str]:
@@ -200,57 +275,51 @@ class JDKScraper:
             for row in table.find_all('tr', class_='milestone'):
                 cells = row.find_all('td')
                 if len(cells) >= 3 and 'General Availability' in cells[2].get_text():
-                    date_str = cells[0].get_text().strip()
-                    try:
-                        # Convert from yyyy/mm/dd to yyyy-mm-dd
-                        from datetime import datetime
-                        date = datetime.strptime(date_str, '%Y/%m/%d')
-                        return date.strftime('%Y-%m-%d')
-                    except ValueError:
-                        continue
+                    # Convert from yyyy/mm/dd to yyyy-mm-dd
+                    release_date = JDKScraper._normalize_date(cells[0].get_text().strip())
+                    if release_date:
+                        return release_date
         
         # If not found in the milestones table, try other methods
         text = soup.get_text()
         
         # Look for General Availability date in text
-        ga_match = re.search(
-            r'General Availability\s*[:]?\s*(\d{4}[/-]\d{1,2}[/-]\d{1,2})', 
-            text, 
-            re.IGNORECASE
-        )
+        ga_match = _GA_DATE_RE.search(text)
         
         if ga_match:
-            date_str = ga_match.group(1).replace('/', '-')
-            try:
-                # Standardize the date format
-                from datetime import datetime
-                date = datetime.strptime(date_str, '%Y-%m-%d')
-                return date.strftime('%Y-%m-%d')
-            except ValueError:
-                pass
+            release_date = JDKScraper._normalize_date(ga_match.group(1))
+            if release_date:
+                return release_date
         
         # Fallback to other date patterns if GA date not found
-        date_patterns = [
-            r'\b(?:Release )?Date\s*[:=]\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})\b',
-            r'\b(?:GA|General Availability).*?(\d{4}[/-]\d{1,2}[/-]\d{1,2})\b',
-            r'\b(?:GA|General Availability)\s+(?:on )?(\w+ \d{1,2}, \d{4})\b',
-            r'\b(?:Released on|as of)\s+(\w+ \d{1,2}, \d{4})\b',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
-                try:
-                    date_str = match.group(1).replace('/', '-')
-                    # Try different date formats
-                    from datetime import datetime
-                    for fmt in ('%Y-%m-%d', '%B %d, %Y', '%b %d, %Y'):
-                        try:
-                            date = datetime.strptime(date_str, fmt)
-                            return date.strftime('%Y-%m-%d')
-                        except ValueError:
-                            continue
-                except (IndexError, AttributeError):
-                    continue
+                date_str = match.group(1)
+                release_date = JDKScraper._normalize_date(date_str)
+                if release_date:
+                    return release_date
+                # Only human-readable dates like "March 18, 2025" need strptime
+                for fmt in ('%B %d, %Y', '%b %d, %Y'):
+                    try:
+                        return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+                    except ValueError:
+                        continue
         
         return None
+    
+    @staticmethod
+    def _normalize_date(date_str: str) -> Optional[str]:
+        """Convert a yyyy/mm/dd or yyyy-mm-dd date to yyyy-mm-dd.
+        
+        Args:
+            date_str: Numeric date with '/' or '-' separators
+            
+        Returns:
+            Optional[str]: Zero-padded YYYY-MM-DD string, or None if not a valid date
+        """
+        try:
+            year, month, day = date_str.replace('/', '-').split('-')
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            return None
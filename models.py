@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import Mapping, Tuple
+
+@dataclass(frozen=True, slots=True)
+class JEP:
+    number: str
+    title: str
+    description: str = ""
+    # Read-only mappings with 'title' and 'content'; left out of the hash
+    # because mappings are not hashable
+    examples: Tuple[Mapping[str, str], ...] = field(default=(), hash=False)
+
+class JDKRelease:
+    def __init__(self, version: str, release_date: str, tagline: str):
+        self.version = version
+        self.release_date = release_date
+        self.tagline = tagline
+        self.jeps = []
+    
+    def add_jep(self, jep: JEP):
+        """Add a JEP to the release"""
+        self.jeps.append(jep)
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from functools import partial
+from typing import Iterator
+from weakref import WeakKeyDictionary
+from pptx.opc.package import OpcPackage
+from pptx.opc.packuri import PackURI
+from pptx.presentation import Presentation
+
+# Last partname index handed out per package and template. python-pptx's
+# OpcPackage.next_partname walks every part in the package on each call,
+# which makes adding many parts (notes slides, charts, ...) quadratic.
+# Weak keys let the counters go away with their package.
+_partname_counters = WeakKeyDictionary()
+
+def _template_index(tmpl: str, partname: str) -> int:
+    """Return the index `partname` has under `tmpl`, or 0 if it doesn't match.
+
+    PackURI.idx can't be used: it gives None for names such as
+    Microsoft_Excel_Sheet1.xlsx.
+    """
+    prefix, _, suffix = tmpl.partition('%d')
+    digits = partname[len(prefix):len(partname) - len(suffix)]
+    if partname.startswith(prefix) and partname.endswith(suffix) and digits.isdigit():
+        return int(digits)
+    return 0
+
+def _next_partname(package: OpcPackage, tmpl: str) -> PackURI:
+    """Drop-in for OpcPackage.next_partname that scans the package only once.
+
+    Unlike python-pptx, which returns the lowest free index, this hands out
+    indexes above the highest one in use, so gaps left by removed parts are
+    not refilled. The counter assumes every partname for `tmpl` in the
+    package comes from here; parts named any other way may be duplicated.
+    """
+    counters = _partname_counters.setdefault(package, {})
+    n = counters.get(tmpl)
+    if n is None:
+        # First use of this template: start after the highest index among
+        # the parts already present, so later increments never collide
+        n = max((_template_index(tmpl, p.partname) for p in package.iter_parts()), default=0) + 1
+    else:
+        n += 1
+    counters[tmpl] = n
+    return PackURI(tmpl % n)
+
+@contextmanager
+def bulk_context(prs: Presentation) -> Iterator[None]:
+    """Name new parts in `prs` from the shared _next_partname counters.
+
+    This is the only place the counter is installed, and only on this
+    package for the duration of the block. It affects parts named through
+    next_partname, such as notes slides, charts and their workbooks; slide
+    and image partnames are chosen elsewhere by python-pptx. Nested use is
+    a no-op.
+    """
+    package = prs.part.package
+    if 'next_partname' in vars(package):
+        yield
+        return
+
+    package.next_partname = partial(_next_partname, package)
+    try:
+        yield
+    finally:
+        del package.next_partname
+        # Stock python-pptx names parts from here on, so the counters would go stale
+        _partname_counters.pop(package, None)
@@ -1,9 +1,12 @@
-from typing import List, Dict
+import io
+import os
+from typing import IO, Dict, Union
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from dataclasses import dataclass
 
+# Re-exported so callers can keep importing the models from here
+from models import JEP, JDKRelease
 from template_config import (
     ORANGE, WHITE, BLACK,
     TITLE_FONT, BODY_FONT,
@@ -12,28 +15,24 @@ from template_config import (
     apply_title_slide_layout, apply_jep_slide_layout, apply_example_slide_layout
 )
 
-@dataclass
-class JEP:
-    number: str
-    title: str
-    description: str = ""
-    examples: List[Dict[str, str]] = None
-    
-    def __post_init__(self):
-        # Ensure examples is always a list
-        if self.examples is None:
-            self.examples = []
+# Downloaded image bytes keyed by URL, so an image used on several slides
+# is only fetched once per process
+_image_cache: Dict[str, bytes] = {}
 
-class JDKRelease:
-    def __init__(self, version: str, release_date: str, tagline: str):
-        self.version = version
-        self.release_date = release_date
-        self.tagline = tagline
-        self.jeps = []
-    
-    def add_jep(self, jep: JEP):
-        """Add a JEP to the release"""
-        self.jeps.append(jep)
+def _fetch_image(image_url: str) -> bytes:
+    """Return the bytes of the image at `image_url`, downloading it once."""
+    content = _image_cache.get(image_url)
+    if content is None:
+        # Imported here so offline runs never load the HTTP dependencies
+        from http_session import IMAGE_TIMEOUT, get_image_session
+        # Streamed so a bad status fails before the body is downloaded
+        with get_image_session().get(
+            image_url, stream=True, timeout=IMAGE_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            content = response.content
+        _image_cache[image_url] = content
+    return content
 
 class JDKPresentationGenerator:
     def __init__(self):
@@ -41,31 +40,33 @@ class JDKPresentationGenerator:
         self.prs.slide_width = 9144000  # 10 inches in EMU (16:9 aspect ratio)
         self.prs.slide_height = 5143500  # 5.625 inches in EMU
         self.current_slide = None
+        
+        # Looked up once; slide_layouts indexing walks the package XML
+        self._title_layout = self.prs.slide_layouts[0]  # Title Slide
+        self._content_layout = self.prs.slide_layouts[1]  # Title and Content
+        self._title_only_layout = self.prs.slide_layouts[5]  # Title Only
+        self._blank_layout = self.prs.slide_layouts[6]  # Blank
+        self._slide_height = self.prs.slide_height
     
     def create_title_slide(self, release: JDKRelease):
         """Create the title slide for the JDK release"""
-        slide_layout = self.prs.slide_layouts[0]  # Title Slide layout
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
+        self.current_slide = self.prs.slides.add_slide(self._title_layout)
         
         title = f"JAVA {release.version}"
         subtitle = f"{release.tagline} (Release date {release.release_date})"
         
-        # Pass the slide height from the presentation
-        slide_height = self.prs.slide_height
-        apply_title_slide_layout(self.current_slide, title, subtitle, slide_height=slide_height)
+        apply_title_slide_layout(self.current_slide, title, subtitle, slide_height=self._slide_height)
     
     def create_jep_slide(self, jep: JEP):
         """Create a slide for a JEP"""
-        slide_layout = self.prs.slide_layouts[1]  # Title and Content layout
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
+        self.current_slide = self.prs.slides.add_slide(self._content_layout)
         
         # Add JEP number and title with centered layout
-        slide_height = self.prs.slide_height
         apply_jep_slide_layout(
             self.current_slide,
             jep.number,
             jep.title,
-            slide_height=slide_height
+            slide_height=self._slide_height
         )
         
         # Add example slides if they exist
@@ -78,10 +79,8 @@ class JDKPresentationGenerator:
     
     def create_example_slide(self, title: str, content: str):
         """Create a slide with an example"""
-        slide_layout = self.prs.slide_layouts[1]  # Title and Content layout
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
-        slide_height = self.prs.slide_height
-        apply_example_slide_layout(self.current_slide, title, content, slide_height=slide_height)
+        self.current_slide = self.prs.slides.add_slide(self._content_layout)
+        apply_example_slide_layout(self.current_slide, title, content, slide_height=self._slide_height)
     
     def add_hardcoded_example_slide(self):
         """Adds a hardcoded example slide to the end of the presentation."""
@@ -95,7 +94,7 @@ class JDKPresentationGenerator:
         )
         self.create_example_slide(title, content)
     
-    def generate_jdk_presentation(self, release: JDKRelease, output_path: str):
+    def generate_jdk_presentation(self, release: JDKRelease, output_path: Union[str, os.PathLike, IO[bytes]]):
         """Generate the complete JDK release presentation"""
         # Create title slide
         self.create_title_slide(release)
@@ -110,14 +109,21 @@ class JDKPresentationGenerator:
         # Save the presentation
         self.save_presentation(output_path)
     
-    def save_presentation(self, filename: str):
-        """Save the presentation to a file."""
-        self.prs.save(filename)
+    def save_presentation(self, target: Union[str, os.PathLike, IO[bytes]]):
+        """Save the presentation to a file path or a writable binary stream."""
+        if isinstance(target, os.PathLike):
+            target = os.fspath(target)
+        self.prs.save(target)
+    
+    def to_bytes(self) -> bytes:
+        """Return the presentation as .pptx bytes without touching the disk."""
+        buffer = io.BytesIO()
+        self.prs.save(buffer)
+        return buffer.getvalue()
 
     def add_title_slide(self, title, subtitle=''):
         """Add a title slide to the presentation."""
-        slide_layout = self.prs.slide_layouts[0]
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
+        self.current_slide = self.prs.slides.add_slide(self._title_layout)
         title_shape = self.current_slide.shapes.title
         subtitle_shape = self.current_slide.placeholders[1]
         
@@ -126,8 +132,7 @@ class JDKPresentationGenerator:
 
     def add_content_slide(self, title, content):
         """Add a content slide with title and bullet points."""
-        slide_layout = self.prs.slide_layouts[1]
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
+        self.current_slide = self.prs.slides.add_slide(self._content_layout)
         title_shape = self.current_slide.shapes.title
         body_shape = self.current_slide.placeholders[1]
         
@@ -137,8 +142,7 @@ class JDKPresentationGenerator:
 
     def add_table_slide(self, title, data):
         """Add a slide with a table."""
-        slide_layout = self.prs.slide_layouts[5]
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
+        self.current_slide = self.prs.slides.add_slide(self._title_only_layout)
         title_shape = self.current_slide.shapes.title
         
         title_shape.text = title
@@ -153,44 +157,41 @@ class JDKPresentationGenerator:
         
         table = self.current_slide.shapes.add_table(rows, cols, left, top, width, height).table
         
+        # Format all values in one pandas call, and walk the rows and cells
+        # once rather than looking each cell up by index
+        values = data.astype(str).to_numpy()
+        rows_iter = iter(table.rows)
+        
         # Add headers
-        for idx, col in enumerate(data.columns):
-            table.cell(0, idx).text = col
+        for cell, col in zip(next(rows_iter).cells, data.columns):
+            cell.text = str(col)
         
         # Add data
-        for idx, row in enumerate(data.itertuples(), 1):
-            for col_idx, value in enumerate(row[1:], 0):
-                table.cell(idx, col_idx).text = str(value)
+        for table_row, row_values in zip(rows_iter, values):
+            for cell, value in zip(table_row.cells, row_values):
+                cell.text = value
 
     def add_image_slide(self, title, image_url):
         """Add a slide with an image."""
-        slide_layout = self.prs.slide_layouts[6]
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
+        self.current_slide = self.prs.slides.add_slide(self._blank_layout)
         title_shape = self.current_slide.shapes.title
         
         title_shape.text = title
         
-        # Download image
-        response = requests.get(image_url)
-        with open('temp_image.jpg', 'wb') as f:
-            f.write(response.content)
-        
-        # Add image
+        # Add image straight from memory; no temporary file needed
         left = Inches(1)
         top = Inches(2)
         width = Inches(6)
         height = Inches(4)
-        self.current_slide.shapes.add_picture('temp_image.jpg', left, top, width, height)
-        os.remove('temp_image.jpg')
-
-    def save_presentation(self, filename):
-        """Save the presentation to a file."""
-        self.prs.save(filename)
+        image = io.BytesIO(_fetch_image(image_url))
+        self.current_slide.shapes.add_picture(image, left, top, width, height)
 
 def generate_presentation_from_web_data(url):
     """Generate a presentation from web data."""
+    from http_session import PAGE_TIMEOUT, get_session
+    
     # Fetch and parse web data
-    response = requests.get(url)
+    response = get_session().get(url, timeout=PAGE_TIMEOUT)
     soup = BeautifulSoup(response.text, 'html.parser')
     
     # Create presentation
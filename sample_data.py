@@ -0,0 +1,53 @@
+from types import MappingProxyType
+from typing import Tuple
+
+from models import JEP
+
+# Sample JEPs used when live data for a release is unavailable. Built once
+# at import and shared, so the JEPs are frozen and their examples are
+# tuples of read-only mappings.
+SAMPLE_JEPS: Tuple[JEP, ...] = (
+    JEP(
+        number="123",
+        title="Pattern Matching for switch (Preview)",
+        description="Enhance the Java programming language with pattern matching for switch expressions and statements.",
+        examples=(
+            MappingProxyType({
+                "title": "Basic Pattern Matching in Switch",
+                'content': '''String response = switch (obj) {
+    case Integer i -> String.format(\"int %d\", i);
+    case String s -> String.format(\"String %s\", s);
+    default -> obj.toString();
+};'''
+            }),
+        )
+    ),
+    JEP(
+        number="456",
+        title="Virtual Threads (Second Preview)",
+        description="Introduce virtual threads to the Java Platform.",
+        examples=(
+            MappingProxyType({
+                "title": "Creating Virtual Threads",
+                'content': '// Create a virtual thread\nThread.startVirtualThread(() -> {\n    System.out.println(\"Hello from virtual thread!\");\n});'
+            }),
+        )
+    ),
+    JEP(
+        number="789",
+        title="Structured Concurrency (Incubator)",
+        description="Simplify multithreaded programming by treating multiple tasks running in different threads as a single unit of work.",
+        examples=(
+            MappingProxyType({
+                'title': 'Structured Concurrency Example',
+                'content': '''try (var scope = StructuredTaskScope.ShutdownOnFailure()) {
+    Future<String> user = scope.fork(() -> findUser());
+    Future<Integer> order = scope.fork(() -> fetchOrder());
+    
+    scope.join();
+    return new Response(user.resultNow(), order.resultNow());
+}'''
+            }),
+        )
+    ),
+)
@@ -1,169 +1,359 @@
-from pptx.util import Pt, Inches
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
+from pptx import Presentation
+from pptx.api import _default_pptx_path
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import namespaces, nsdecls, qn
+from lxml import etree
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.oxml.xmlchemy import BaseOxmlElement
+from pptx.presentation import Presentation as PresentationType
+from pptx.slide import Slide
+from multiprocessing import Pool
+from copy import deepcopy
+from io import BytesIO
+from functools import lru_cache
+from xml.sax.saxutils import quoteattr
+import os
 import re
+import sys
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
 # Colors
 ORANGE = RGBColor(255, 87, 34)  # FF5722
 WHITE = RGBColor(255, 255, 255)
 BLACK = RGBColor(0, 0, 0)
 
+# Lengths and font sizes are plain EMU integers, 914400 per inch and 12700
+# per point, so no pptx.util Length objects are built for them
+_EMU_PER_CENTIPOINT = 127
+
 # Fonts
 TITLE_FONT = 'Alfa Slab One'
 BODY_FONT = 'Roboto'
-TITLE_FONT_SIZE = Pt(48)
-SUBTITLE_FONT_SIZE = Pt(24)
-JEP_TITLE_FONT_SIZE = Pt(24)
+TITLE_FONT_SIZE = 609600  # Pt(48)
+SUBTITLE_FONT_SIZE = 304800  # Pt(24)
+JEP_TITLE_FONT_SIZE = 304800  # Pt(24)
 
 # Layout
-TITLE_TOP_MARGIN = Inches(2)
-CONTENT_LEFT_MARGIN = Inches(1)
-CONTENT_TOP_MARGIN = Inches(2)
-CONTENT_WIDTH = Inches(8.5)
+TITLE_TOP_MARGIN = 1828800  # Inches(2)
+CONTENT_LEFT_MARGIN = 914400  # Inches(1)
+CONTENT_TOP_MARGIN = 1828800  # Inches(2)
+CONTENT_WIDTH = 7772400  # Inches(8.5)
 
 # Slide dimensions (16:9 aspect ratio)
-SLIDE_WIDTH = Inches(10)
-SLIDE_HEIGHT = Inches(5.625)
+SLIDE_WIDTH = 9144000  # Inches(10)
+SLIDE_HEIGHT = 5143500  # Inches(5.625)
 
-def apply_title_slide_layout(slide, title_text, subtitle_text, slide_height=Inches(5.625)):
-    """Apply layout for title slide"""
-    # Set background
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = ORANGE
+# Text block geometry shared by the slide layouts
+BOX_LEFT = 548640  # Inches(0.6)
+BOX_WIDTH = 8229600  # Inches(9)
+TITLE_BLOCK_TITLE_H = 1371600  # Inches(1.5), approximate height for a title line
+TITLE_BLOCK_SUBTITLE_H = 640080  # Inches(0.7), approximate height for a subtitle line
+JEP_NUM_H = 914400  # Inches(1.0), approximate height for the JEP number
+JEP_SPACING = 274320  # Inches(0.3), space between JEP number and title
+EX_TOP = 457200  # Inches(0.5)
+EX_H = 4114800  # Inches(4.5), example title and code share one text box
+SPACE_AFTER_TITLE = 152400  # Pt(12)
+
+# Text block heights and their centered top offsets on a default-height slide
+_TITLE_TOTAL = TITLE_BLOCK_TITLE_H + TITLE_BLOCK_SUBTITLE_H
+_TITLE_TOP_WITH_SUB = (SLIDE_HEIGHT - _TITLE_TOTAL) // 2
+_TITLE_TOP_NO_SUB = (SLIDE_HEIGHT - TITLE_BLOCK_TITLE_H) // 2
+_JEP_TOTAL = JEP_NUM_H + JEP_SPACING + TITLE_BLOCK_TITLE_H
+_JEP_TOP = (SLIDE_HEIGHT - _JEP_TOTAL) // 2
+
+# Code examples
+CODE_FONT = 'Courier New'  # Monospace font for code
+CODE_FONT_SIZE = 203200  # Pt(16), fixed size that should work for most cases
+
+def _solid_fill_xml(color: RGBColor) -> str:
+    """Return <a:solidFill> markup for `color`, as python-pptx writes it"""
+    return '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % (color,)
+
+# Fill markup formatted once, so no color is converted to hex per slide
+_WHITE_FILL = _solid_fill_xml(WHITE)
+
+# Solid orange slide background, built once and copied onto each slide
+_ORANGE_BG = parse_xml(
+    '<p:bg %s><p:bgPr>%s<a:effectLst/></p:bgPr></p:bg>'
+    % (nsdecls('p', 'a'), _solid_fill_xml(ORANGE))
+)
+
+# Top-level shapes that carry no visible text: text shapes whose runs are
+# all blank, plus every shape kind that has no text frame at all. Compiled
+# once here rather than on every spTree.xpath() call.
+_EMPTY_SHAPES_XPATH = etree.XPath(
+    './p:sp[not(.//a:t[normalize-space()])]'
+    ' | ./p:grpSp | ./p:graphicFrame | ./p:cxnSp | ./p:pic | ./p:contentPart',
+    namespaces=namespaces('a', 'p'),
+)
+
+def _reset_slide_proxies(slide: Slide) -> None:
+    """Drop proxies python-pptx cached for the slide's old content, such as shapes"""
+    for name in ('shapes', 'placeholders', 'background'):
+        vars(slide).pop(name, None)
+
+# Empty slide content that _apply_layout fills in
+_CSLD_SHELL = parse_xml('<p:cSld %s><p:spTree/></p:cSld>' % nsdecls('p'))
+
+# Text body prototypes for each layout. Every text box is given a copy of
+# its whole <p:txBody>, parsed once at import, instead of styling
+# paragraphs one attribute at a time; only the text is filled in per slide.
+# The markup matches what the python-pptx text APIs produce.
+_CENTERED_BODY_PR = '<a:bodyPr wrap="none" anchor="ctr"><a:spAutoFit/></a:bodyPr>'
+_WRAPPED_BODY_PR = '<a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr>'
+
+def _paragraph_xml(font: str, size: int, space_after: Optional[int] = None, bold: bool = False) -> str:
+    """Return markup for an empty left-aligned white paragraph"""
+    spacing = ''
+    if space_after is not None:
+        spacing = '<a:spcAft><a:spcPts val="%d"/></a:spcAft>' % (space_after // _EMU_PER_CENTIPOINT)
+    return (
+        '<a:p><a:pPr algn="l">%s<a:defRPr sz="%d"%s>'
+        '%s<a:latin typeface=%s/></a:defRPr></a:pPr></a:p>'
+    ) % (spacing, size // _EMU_PER_CENTIPOINT, ' b="1"' if bold else '', _WHITE_FILL, quoteattr(font))
+
+def _txBody_proto(body_pr: str, *paragraphs: str) -> BaseOxmlElement:
+    """Parse a complete <p:txBody> holding `paragraphs`"""
+    return parse_xml('<p:txBody %s>%s<a:lstStyle/>%s</p:txBody>' % (
+        nsdecls('a', 'p'), body_pr, ''.join(paragraphs)
+    ))
+
+_TITLE_TXBODY = _txBody_proto(
+    _CENTERED_BODY_PR,
+    _paragraph_xml(TITLE_FONT, TITLE_FONT_SIZE, space_after=SPACE_AFTER_TITLE),
+    _paragraph_xml(BODY_FONT, SUBTITLE_FONT_SIZE)
+)
+_TITLE_ONLY_TXBODY = _txBody_proto(
+    _CENTERED_BODY_PR,
+    _paragraph_xml(TITLE_FONT, TITLE_FONT_SIZE)
+)
+_JEP_TXBODY = _txBody_proto(
+    _CENTERED_BODY_PR,
+    _paragraph_xml(TITLE_FONT, TITLE_FONT_SIZE, space_after=SPACE_AFTER_TITLE),
+    _paragraph_xml(BODY_FONT, SUBTITLE_FONT_SIZE)
+)
+_EX_TXBODY = _txBody_proto(
+    _WRAPPED_BODY_PR,
+    _paragraph_xml(TITLE_FONT, TITLE_FONT_SIZE, space_after=SPACE_AFTER_TITLE),
+    _paragraph_xml(CODE_FONT, CODE_FONT_SIZE, bold=True)
+)
+
+@lru_cache(maxsize=256)
+def _filled_txBody(proto: BaseOxmlElement, texts: Tuple[str, ...]) -> BaseOxmlElement:
+    """Return a copy of `proto` with `texts` filling its last paragraphs
     
-    # Clear any existing placeholders first
-    for shape in slide.shapes:
-        if not (shape.has_text_frame and shape.text.strip()):
-            sp = shape._element
-            sp.getparent().remove(sp)
+    Cached so repeated headings and subtitles are only built once; callers
+    must copy the result rather than insert it.
+    """
+    txBody = deepcopy(proto)
+    for p, text in zip(txBody.p_lst[-len(texts):], texts):
+        # Adds runs and line breaks, escaped, just as _Paragraph.text does
+        p.append_text(text)
+    return txBody
+
+# Layout specs: the background to paint and the text boxes to add, each as
+# (left, top, width, height, centered, txBody prototype, text slots). `top`
+# is for a default-height slide; centered boxes are re-centered on others.
+BoxSpec = Tuple[int, int, int, int, bool, BaseOxmlElement, Tuple[str, ...]]
+LayoutSpec = Tuple[BaseOxmlElement, Tuple[BoxSpec, ...]]
+
+TITLE_SPEC: LayoutSpec = (_ORANGE_BG, (
+    (BOX_LEFT, _TITLE_TOP_WITH_SUB, BOX_WIDTH, _TITLE_TOTAL, True,
+     _TITLE_TXBODY, ('title', 'subtitle')),
+))
+TITLE_ONLY_SPEC: LayoutSpec = (_ORANGE_BG, (
+    (BOX_LEFT, _TITLE_TOP_NO_SUB, BOX_WIDTH, TITLE_BLOCK_TITLE_H, True,
+     _TITLE_ONLY_TXBODY, ('title',)),
+))
+JEP_SPEC: LayoutSpec = (_ORANGE_BG, (
+    (BOX_LEFT, _JEP_TOP, BOX_WIDTH, _JEP_TOTAL, True,
+     _JEP_TXBODY, ('number', 'title')),
+))
+EXAMPLE_SPEC: LayoutSpec = (_ORANGE_BG, (
+    # Title at the top with the code below it, in one word-wrapped box
+    (BOX_LEFT, EX_TOP, BOX_WIDTH, EX_H, False,
+     _EX_TXBODY, ('title', 'content')),
+))
+
+def _apply_layout(slide: Slide, spec: LayoutSpec, texts: Dict[str, str], slide_height: int = SLIDE_HEIGHT) -> None:
+    """Paint the background and add the text boxes described by `spec`
     
-    # Calculate total height needed for title and subtitle
-    title_height = Inches(1.5)  # Approximate height for title
-    subtitle_height = Inches(0.7)  # Approximate height for subtitle
-    total_height = title_height + (subtitle_height if subtitle_text else 0)
+    Args:
+        slide: Slide to lay out
+        spec: One of the *_SPEC layout tuples
+        texts: Text for each slot named in the spec
+        slide_height: Height used to center the centered boxes
+    """
+    bg, boxes = spec
+    sld = slide._element
+    old_cSld = sld.cSld
+    old_spTree = old_cSld.spTree
     
-    # Calculate top position to center the whole block
-    left = Inches(0.6)
-    width = Inches(9)
-    top = (slide_height - total_height) / 2  # Center vertically on slide
+    # Build the new slide content detached, then swap it in with one replace
+    cSld = deepcopy(_CSLD_SHELL)
+    cSld.attrib.update(old_cSld.attrib)
+    cSld.insert(0, deepcopy(bg))
+    spTree = cSld.spTree
     
-    # Create a single text box for both title and subtitle
-    text_box = slide.shapes.add_textbox(left, top, width, total_height)
-    text_frame = text_box.text_frame
-    text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+    # Keep the group properties and every shape that has text. Only the
+    # group's own nvGrpSpPr and grpSpPr are present on a blank layout.
+    empty = _EMPTY_SHAPES_XPATH(old_spTree) if len(old_spTree) > 2 else ()
+    for child in list(old_spTree):
+        if child not in empty:
+            spTree.append(child)
+    for child in list(old_cSld):
+        if child.tag not in (qn('p:bg'), qn('p:spTree')):
+            cSld.append(child)
     
-    # Add title
-    title = text_frame.add_paragraph()
-    title.text = title_text
-    title.font.name = TITLE_FONT
-    title.font.size = TITLE_FONT_SIZE
-    title.font.color.rgb = WHITE
-    title.alignment = PP_ALIGN.LEFT
+    # Number and name the text boxes the way slide.shapes.add_textbox does
+    id_ = spTree.max_shape_id + 1
+    for left, top, width, height, centered, proto, slots in boxes:
+        if centered and slide_height != SLIDE_HEIGHT:
+            top = (slide_height - height) // 2
+        sp = CT_Shape.new_textbox_sp(id_, 'TextBox %d' % (id_ - 1), left, top, width, height)
+        sp.replace(sp.txBody, deepcopy(_filled_txBody(proto, tuple(texts[slot] for slot in slots))))
+        spTree.insert_element_before(sp, 'p:extLst')
+        id_ += 1
     
-    # Add subtitle if provided
+    sld.replace(old_cSld, cSld)
+    _reset_slide_proxies(slide)
+
+def apply_title_slide_layout(slide: Slide, title_text: str, subtitle_text: Optional[str], slide_height: int = SLIDE_HEIGHT) -> None:
+    """Apply layout for title slide"""
     if subtitle_text:
-        subtitle = text_frame.add_paragraph()
-        subtitle.text = subtitle_text
-        subtitle.font.name = BODY_FONT
-        subtitle.font.size = SUBTITLE_FONT_SIZE
-        subtitle.font.color.rgb = WHITE
-        subtitle.alignment = PP_ALIGN.LEFT
-        # Add some space after the title
-        title.space_after = Pt(12)
-
-def apply_jep_slide_layout(slide, jep_number, jep_title, jep_description=None, slide_height=Inches(5.625)):
+        _apply_layout(slide, TITLE_SPEC, {'title': title_text, 'subtitle': subtitle_text}, slide_height)
+    else:
+        _apply_layout(slide, TITLE_ONLY_SPEC, {'title': title_text}, slide_height)
+
+@lru_cache(maxsize=1024)
+def _jep_label(jep_number: Union[int, str]) -> str:
+    """Return the interned "JEP <number>" label shown on a JEP slide"""
+    return sys.intern(f"JEP {jep_number}")
+
+def apply_jep_slide_layout(slide: Slide, jep_number: Union[int, str], jep_title: str, jep_description: Optional[str] = None, slide_height: int = SLIDE_HEIGHT) -> None:
     """Apply layout for JEP slide with centered JEP number and title in a single text box"""
-    # Set background
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = ORANGE
-    
-    # Clear any existing placeholders first
-    for shape in slide.shapes:
-        if not (shape.has_text_frame and shape.text.strip()):
-            sp = shape._element
-            sp.getparent().remove(sp)
-    
-    # Calculate total height needed for JEP number and title
-    jep_number_height = Inches(1.0)  # Approximate height for JEP number
-    title_height = Inches(1.5)       # Approximate height for title
-    spacing = Inches(0.3)            # Space between number and title
-    total_height = jep_number_height + spacing + title_height
-    
-    # Calculate top position to center the whole block
-    left = Inches(0.6)
-    width = Inches(9)
-    top = (slide_height - total_height) / 2
-    
-    # Create a single text box for both JEP number and title
-    text_box = slide.shapes.add_textbox(left, top, width, total_height)
-    text_frame = text_box.text_frame
-    text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-    
-    # Add JEP number
-    number = text_frame.add_paragraph()
-    number.text = f"JEP {jep_number}"
-    number.font.name = TITLE_FONT
-    number.font.size = TITLE_FONT_SIZE
-    number.font.color.rgb = WHITE
-    number.alignment = PP_ALIGN.LEFT
-    
     clean_title = re.sub(r'\s+', ' ', jep_title.replace('\r', ' ').replace('\n', ' ')).strip()
+    _apply_layout(slide, JEP_SPEC, {'number': _jep_label(jep_number), 'title': clean_title}, slide_height)
 
-    # Add JEP title
-    title = text_frame.add_paragraph()
-    title.text = clean_title
-    title.font.name = BODY_FONT
-    title.font.size = SUBTITLE_FONT_SIZE
-    title.font.color.rgb = WHITE
-    title.alignment = PP_ALIGN.LEFT
-    number.space_after = Pt(12)
-
-def apply_example_slide_layout(slide, title, content, slide_height=Inches(5.625)):
+def apply_example_slide_layout(slide: Slide, title: str, content: str, slide_height: int = SLIDE_HEIGHT) -> None:
     """Apply layout for example slide with auto-fitting code"""
-    # Set background
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = ORANGE
+    _apply_layout(slide, EXAMPLE_SPEC, {'title': title, 'content': content}, slide_height)
+
+# Bytes of python-pptx's default template, read on first use
+_default_template = None
+
+def _scratch_presentation() -> PresentationType:
+    """Return a new throwaway presentation opened from the cached default template"""
+    global _default_template
+    if _default_template is None:
+        with open(_default_pptx_path(), 'rb') as f:
+            _default_template = f.read()
+    return Presentation(BytesIO(_default_template))
+
+def build_title_prototype(prs: PresentationType) -> BaseOxmlElement:
+    """Return a styled title <p:sld> element, built in a scratch presentation, for clone_title_slide"""
+    scratch = _scratch_presentation()
+    slide = scratch.slides.add_slide(scratch.slide_layouts[6])
+    # Non-empty stand-in texts so both paragraphs are present
+    apply_title_slide_layout(slide, 'title', 'subtitle', slide_height=prs.slide_height)
+    return deepcopy(slide._element)
+
+def _replace_slide_content(slide: Slide, sld: BaseOxmlElement) -> None:
+    """Move the children of the <p:sld> element `sld` into `slide`, replacing its own"""
+    element = slide._element
+    for child in list(element):
+        element.remove(child)
+    for child in list(sld):
+        element.append(child)
+    _reset_slide_proxies(slide)
+
+def clone_title_slide(prs: PresentationType, proto: BaseOxmlElement, title_text: str, subtitle_text: Optional[str]) -> Slide:
+    """Add a title slide to `prs` by copying `proto` and replacing its two texts"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+    if not subtitle_text:
+        # The prototype is laid out for a subtitle; build this one from scratch
+        apply_title_slide_layout(slide, title_text, subtitle_text, slide_height=prs.slide_height)
+        return slide
+    
+    _replace_slide_content(slide, deepcopy(proto))
+    sld = slide._element
+    txBody = sld.cSld.spTree.xpath('./p:sp/p:txBody')[-1]
+    for p, text in zip(txBody.p_lst[-2:], (title_text, subtitle_text)):
+        for run in p.content_children:
+            p.remove(run)
+        p.append_text(text)
+    return slide
+
+def render_title_slide_xml(title_text: str, subtitle_text: Optional[str], slide_height: int = SLIDE_HEIGHT) -> bytes:
+    """Return the <p:sld> XML of a title slide, for add_slide_from_xml
     
-    # Clear any existing placeholders first
-    for shape in slide.shapes:
-        if not (shape.has_text_frame and shape.text.strip()):
-            sp = shape._element
-            sp.getparent().remove(sp)
+    Written by stream_apply_title_slide, so no presentation is built; this
+    keeps the per-slide cost in a worker process below the serial layout.
+    """
+    buffer = BytesIO()
+    stream_apply_title_slide(buffer, title_text, subtitle_text, slide_height)
+    return buffer.getvalue()
+
+def add_slide_from_xml(prs: PresentationType, xml: bytes) -> Slide:
+    """Add a blank-layout slide to `prs` with the content of a serialized <p:sld>"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    _replace_slide_content(slide, parse_xml(xml))
+    return slide
+
+def add_title_slides_parallel(prs: PresentationType, texts: List[Tuple[str, Optional[str]]], processes: Optional[int] = None, chunksize: Optional[int] = None) -> List[Slide]:
+    """Render (title, subtitle) pairs into title slides across worker processes
     
-    # Add title at the top
-    title_shape = slide.shapes.add_textbox(Inches(0.6), Inches(0.5), Inches(9), Inches(1))
-    title_shape.text = title
-    title_frame = title_shape.text_frame
+    Args:
+        prs: Presentation to add the slides to, in the order of `texts`
+        texts: Title and subtitle for each slide
+        processes: Number of worker processes, one per CPU by default
+        chunksize: Slides sent to a worker per task; by default the work is
+            split into about four chunks per worker
     
-    # Style title
-    title_frame.paragraphs[0].font.name = TITLE_FONT
-    title_frame.paragraphs[0].font.size = TITLE_FONT_SIZE
-    title_frame.paragraphs[0].font.color.rgb = WHITE
-    title_frame.paragraphs[0].alignment = PP_ALIGN.LEFT
+    Returns:
+        The slides that were added
+    """
+    args = [(title, subtitle, prs.slide_height) for title, subtitle in texts]
+    if chunksize is None:
+        chunksize = max(1, len(args) // (4 * (processes or os.cpu_count() or 1)))
+    with Pool(processes) as pool:
+        xmls = pool.starmap(render_title_slide_xml, args, chunksize)
+    return [add_slide_from_xml(prs, xml) for xml in xmls]
+
+# Fixed parts of a slide written by stream_apply_title_slide, matching what
+# python-pptx puts on a new slide
+_GROUP_PROPS = (
+    parse_xml('<p:nvGrpSpPr %s><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>' % nsdecls('p')),
+    parse_xml('<p:grpSpPr %s/>' % nsdecls('p')),
+)
+_CLR_MAP_OVR = parse_xml('<p:clrMapOvr %s><a:masterClrMapping/></p:clrMapOvr>' % nsdecls('p', 'a'))
+
+def stream_apply_title_slide(fp: BinaryIO, title_text: str, subtitle_text: Optional[str], slide_height: int = SLIDE_HEIGHT) -> None:
+    """Write a complete title slide <p:sld> document to the binary file `fp`
     
-    # Add content in a separate text box below the title
-    content_box = slide.shapes.add_textbox(
-        left=Inches(0.6),
-        top=Inches(1.5),
-        width=Inches(9),
-        height=Inches(3.5)
-    )
+    The slide is serialized element by element with lxml's xmlfile instead
+    of being built inside a presentation. The XML is the same as
+    apply_title_slide_layout produces on a blank slide and can be added to a
+    presentation with add_slide_from_xml.
+    """
+    if subtitle_text:
+        spec, texts = TITLE_SPEC, (title_text, subtitle_text)
+    else:
+        spec, texts = TITLE_ONLY_SPEC, (title_text,)
+    bg, ((left, top, width, height, centered, proto, _),) = spec
+    if centered and slide_height != SLIDE_HEIGHT:
+        top = (slide_height - height) // 2
     
-    # Set text frame properties
-    text_frame = content_box.text_frame
-    text_frame.word_wrap = True
+    sp = CT_Shape.new_textbox_sp(2, 'TextBox 1', left, top, width, height)
+    sp.replace(sp.txBody, deepcopy(_filled_txBody(proto, texts)))
     
-    # Add content as a single paragraph with a monospace font for code
-    p = text_frame.add_paragraph()
-    p.text = content
-    p.font.name = 'Courier New'  # Monospace font for code
-    p.font.size = Pt(16)  # Fixed size that should work for most cases
-    p.font.color.rgb = WHITE
-    p.alignment = PP_ALIGN.LEFT
-    p.font.bold = True
+    with etree.xmlfile(fp, encoding='UTF-8') as xf:
+        xf.write_declaration(standalone=True)
+        with xf.element(qn('p:sld'), nsmap=namespaces('a', 'p', 'r')):
+            with xf.element(qn('p:cSld')):
+                xf.write(bg)
+                with xf.element(qn('p:spTree')):
+                    xf.write(*_GROUP_PROPS)
+                    xf.write(sp)
+            xf.write(_CLR_MAP_OVR)
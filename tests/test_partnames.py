@@ -0,0 +1,93 @@
+import io
+import unittest
+import zipfile
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+
+from partnames import bulk_context
+
+
+def _add_slide_with_parts(prs):
+    """Add a blank slide with a notes slide and a chart (plus its workbook)"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide.notes_slide
+    chart_data = CategoryChartData()
+    chart_data.categories = ['a', 'b']
+    chart_data.add_series('s', (1, 2))
+    slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, 100, 100, chart_data)
+    return slide
+
+
+def _reopen(prs):
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    buffer.seek(0)
+    return Presentation(buffer), buffer
+
+
+def _deck_with_gaps():
+    """Return a presentation whose notes, charts and workbooks are numbered 1, 3, 5"""
+    prs = Presentation()
+    for _ in range(5):
+        _add_slide_with_parts(prs)
+    sldIdLst = prs.slides._sldIdLst
+    for index in (3, 1):
+        sldId = sldIdLst[index]
+        prs.part.drop_rel(sldId.rId)
+        sldIdLst.remove(sldId)
+    return _reopen(prs)[0]
+
+
+def _indexes(prs, prefix):
+    """Return the sorted indexes of the parts whose names start with `prefix`"""
+    return sorted(
+        int(p.partname[len(prefix):].partition('.')[0])
+        for p in prs.part.package.iter_parts() if p.partname.startswith(prefix)
+    )
+
+
+class BulkContextTest(unittest.TestCase):
+    PREFIXES = (
+        '/ppt/notesSlides/notesSlide',
+        '/ppt/charts/chart',
+        '/ppt/embeddings/Microsoft_Excel_Sheet',
+    )
+
+    def test_never_reuses_an_index_when_existing_indexes_have_gaps(self):
+        prs = _deck_with_gaps()
+        for prefix in self.PREFIXES:
+            self.assertEqual(_indexes(prs, prefix), [1, 3, 5], prefix)
+
+        with bulk_context(prs):
+            for _ in range(3):
+                _add_slide_with_parts(prs)
+        # Stock python-pptx names parts again after the block
+        _add_slide_with_parts(prs)
+
+        for prefix in self.PREFIXES:
+            indexes = _indexes(prs, prefix)
+            self.assertEqual(len(indexes), len(set(indexes)), prefix)
+            self.assertTrue({1, 3, 5, 6, 7, 8} <= set(indexes), prefix)
+
+        reopened, buffer = _reopen(prs)
+        names = zipfile.ZipFile(buffer).namelist()
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(len(reopened.slides), 7)
+
+    def test_restores_package_and_drops_counters_on_exit(self):
+        prs = Presentation()
+        package = prs.part.package
+        with bulk_context(prs):
+            with bulk_context(prs):
+                _add_slide_with_parts(prs)
+            self.assertIn('next_partname', vars(package))
+        self.assertNotIn('next_partname', vars(package))
+        _add_slide_with_parts(prs)
+        for prefix in self.PREFIXES:
+            self.assertEqual(_indexes(prs, prefix), [1, 2], prefix)
+
+
+if __name__ == '__main__':
+    unittest.main()